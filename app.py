@@ -9,14 +9,21 @@ import json
 import logging
 import os
 import time
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import threading
-import random
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any
 
-from flask import Flask, request, jsonify, render_template_string
-from flask_socketio import SocketIO, emit
+import numpy as np
+import orjson
+import redis.asyncio as aioredis
+import socketio
+import uvicorn
+from a2wsgi import WSGIMiddleware
+from flask import Flask, request
 from flask_cors import CORS
+from jinja2 import Template
+from redis.exceptions import RedisError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,149 +31,505 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'aimmy-v2-secret-key')
-socketio = SocketIO(app, cors_allowed_origins="*")
 CORS(app)
 
+def ojsonify(obj):
+    """Build a JSON response encoded with orjson"""
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+class OrjsonShim:
+    """Minimal json-module stand-in so Socket.IO encodes packets with orjson.
+    
+    Payloads that are already serialized can be emitted as orjson.Fragment
+    and are spliced into the packet without being re-encoded.
+    """
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+# Optional Redis message queue so emits reach clients attached to other
+# server instances (requires sticky sessions at the load balancer). Only the
+# instance holding the detection lock runs ticks; bridge data, metrics and
+# start/stop state stay per instance.
+REDIS_URL = os.environ.get('REDIS_URL')
+client_manager = socketio.AsyncRedisManager(REDIS_URL) if REDIS_URL else None
+
+# Socket.IO runs natively on the ASGI event loop; Flask routes are served
+# through a WSGI adapter thread pool behind it
+sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins="*", json=OrjsonShim,
+                           client_manager=client_manager)
+event_loop = None
+
+def _on_startup():
+    """Remember the server event loop so worker threads can emit"""
+    global event_loop
+    event_loop = asyncio.get_running_loop()
+
+asgi = socketio.ASGIApp(sio, other_asgi_app=WSGIMiddleware(app), on_startup=_on_startup)
+
+def encoded_payload(data):
+    """Wrap pre-encoded JSON bytes for emitting.
+    
+    The Redis manager pickles messages for other instances, which
+    orjson.Fragment does not support, so the bytes are decoded back to plain
+    objects in that mode.
+    """
+    return orjson.loads(data) if client_manager else orjson.Fragment(data)
+
+def _log_emit_error(future):
+    if not future.cancelled() and future.exception():
+        logger.error(f"Emit failed: {future.exception()}")
+
+def broadcast(event, data):
+    """Emit an event to all connected clients from any thread"""
+    if event_loop is None:
+        return
+    future = asyncio.run_coroutine_threadsafe(sio.emit(event, data), event_loop)
+    future.add_done_callback(_log_emit_error)
+
+def run_on_loop(coro):
+    """Run a coroutine on the server event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, event_loop).result()
+
+# Per-client detection_update senders, keyed by sid; the detection loop
+# idles while there are none. Only touched from the event loop.
+client_senders = {}
+latest_detection = None
+
+# Frames a client may have unacknowledged before newer ticks are coalesced,
+# enough to keep a 20 Hz stream flowing over a ~200 ms round trip
+ACK_WINDOW = 4
+# Seconds to wait on a full window before treating its frames as lost
+ACK_TIMEOUT = 1.0
+
+@dataclass(slots=True)
+class ClientSender:
+    """Flow-control state for one client's detection_update stream"""
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    acked: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+    in_flight: int = 0
+    has_acked: bool = False
+    plain: bool = False
+
+async def _detection_sender(sid, sender):
+    """Send one client the newest detection_update, up to ACK_WINDOW ahead.
+    
+    While the window is full, ticks are coalesced into the latest one instead
+    of being queued. Clients that have never sent a detection_ack (external
+    listeners, cached copies of the old page) fall back to plain emits until
+    they do.
+    """
+    while True:
+        await sender.ready.wait()
+        sender.acked.clear()
+        if not sender.plain and sender.in_flight >= ACK_WINDOW:
+            try:
+                await asyncio.wait_for(sender.acked.wait(), ACK_TIMEOUT)
+            except asyncio.TimeoutError:
+                sender.in_flight = 0
+                sender.plain = not sender.has_acked
+            continue
+        sender.ready.clear()
+        try:
+            await sio.emit('detection_update', latest_detection, to=sid)
+            if not sender.plain:
+                sender.in_flight += 1
+        except Exception as e:
+            logger.error(f"Detection sender error for {sid}: {e}")
+
+async def publish_detection(payload):
+    """Hand a detection_update payload to every client sender"""
+    global latest_detection
+    if REDIS_URL:
+        # Clients on other instances have no local sender; broadcast instead
+        await sio.emit('detection_update', payload)
+        return
+    latest_detection = payload
+    for sender in client_senders.values():
+        sender.ready.set()
+
+@sio.event
+def connect(sid, environ):
+    sender = ClientSender()
+    sender.task = asyncio.create_task(_detection_sender(sid, sender))
+    client_senders[sid] = sender
+
+@sio.event
+def disconnect(sid):
+    sender = client_senders.pop(sid, None)
+    if sender:
+        sender.task.cancel()
+
+@sio.event
+def detection_ack(sid):
+    sender = client_senders.get(sid)
+    if sender:
+        # A late ack also brings a plain-mode client back to coalescing
+        sender.in_flight = max(sender.in_flight - 1, 0)
+        sender.has_acked = True
+        sender.plain = False
+        sender.acked.set()
+
 # Global state
-detection_engine = None
 is_detecting = False
-detection_metrics = {
-    "total_detections": 0,
-    "last_detection_time": None,
-    "average_processing_time": 0,
-    "successful_targets": 0
-}
 
-# Store bridge data
+class DetectionMetrics(NamedTuple):
+    """Immutable metrics snapshot, replaced wholesale on every tick"""
+    total_detections: int = 0
+    last_detection_time: Optional[str] = None
+    average_processing_time: float = 0
+    successful_targets: int = 0
+
+detection_metrics = DetectionMetrics()
+
+# Store bridge data, along with its JSON encoding for GET requests
 bridge_processes = []
+bridge_processes_json = b'[]'
+
+# Random source for the detection simulation
+rng = np.random.default_rng()
+
+# Payload prefix for ticks without detections (the common case)
+EMPTY_DETECTIONS_HEAD = b'{"detections":[],"best_target":null'
+
+# API configuration keys and the Config fields they map to
+CONFIG_KEYS = {
+    "ConfidenceThreshold": "confidence_threshold",
+    "MouseSensitivity": "mouse_sensitivity",
+    "DetectionInterval": "detection_interval",
+    "EnableESP": "enable_esp",
+    "EnableAntiRecoil": "enable_anti_recoil",
+    "TargetProcess": "target_process",
+    "FOV": "fov",
+    "EnableSmoothing": "enable_smoothing",
+    "SmoothingStrength": "smoothing_strength",
+    "EnableTriggerBot": "enable_trigger_bot",
+    "TriggerDelay": "trigger_delay",
+    "ModelPath": "model_path",
+    "EnableDebugMode": "enable_debug_mode"
+}
+
+def _parse_env(kind, raw):
+    """Parse an environment variable string as a Config field type"""
+    if kind is bool:
+        return raw.lower() == 'true'
+    return kind(raw)
+
+def _check_json(kind, key, value):
+    """Validate a JSON value from the API against a Config field type"""
+    # bool is a subclass of int, so it has to be ruled out explicitly
+    if kind is bool:
+        ok = isinstance(value, bool)
+    elif kind is float:
+        ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif kind is int:
+        ok = isinstance(value, int) and not isinstance(value, bool)
+    else:
+        ok = isinstance(value, kind)
+    if not ok:
+        raise ValueError(f"{key} must be of type {kind.__name__}")
+    return kind(value)
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Detection configuration; replaced as a whole whenever it changes.
+    
+    Each field is read from the environment variable of the same name in
+    upper case.
+    """
+    confidence_threshold: float = 0.5
+    mouse_sensitivity: float = 1.0
+    detection_interval: int = 50
+    enable_esp: bool = True
+    enable_anti_recoil: bool = False
+    target_process: str = ""
+    fov: int = 100
+    enable_smoothing: bool = True
+    smoothing_strength: int = 5
+    enable_trigger_bot: bool = False
+    trigger_delay: int = 50
+    model_path: str = "Models/yolov8n.onnx"
+    enable_debug_mode: bool = True
+    
+    def __post_init__(self):
+        # Runs for from_env() and for every updated() copy alike
+        if self.detection_interval < 1:
+            raise ValueError("DetectionInterval must be at least 1 ms")
+        if not 0 <= self.confidence_threshold <= 1:
+            raise ValueError("ConfidenceThreshold must be between 0 and 1")
+        for key in ("MouseSensitivity", "FOV", "SmoothingStrength", "TriggerDelay"):
+            if getattr(self, CONFIG_KEYS[key]) < 0:
+                raise ValueError(f"{key} must not be negative")
+    
+    @classmethod
+    def from_env(cls):
+        """Load configuration from environment or defaults"""
+        values = {}
+        for f in fields(cls):
+            raw = os.environ.get(f.name.upper())
+            if raw is not None:
+                values[f.name] = _parse_env(f.type, raw)
+        return cls(**values)
+    
+    def updated(self, changes):
+        """Return a copy with API-keyed changes applied"""
+        values = {}
+        for key, value in changes.items():
+            name = CONFIG_KEYS.get(key)
+            if name is None:
+                raise ValueError(f"Unknown configuration key: {key}")
+            values[name] = _check_json(self.__dataclass_fields__[name].type, key, value)
+        return replace(self, **values)
+    
+    def to_dict(self):
+        """Configuration keyed the way the API exposes it"""
+        return {key: getattr(self, name) for key, name in CONFIG_KEYS.items()}
+
+# Parsed once at import; /api/reload re-reads the environment
+DEFAULT_CONFIG = Config.from_env()
+
+class Detection(NamedTuple):
+    """A simulated detection; expanded to the API shape only when encoded"""
+    label: str
+    confidence: float
+    x: int
+    y: int
+    width: int
+    height: int
+    
+    def as_json(self):
+        return {
+            "label": self.label,
+            "confidence": self.confidence,
+            "bounding_box": {"x": self.x, "y": self.y, "width": self.width, "height": self.height},
+            "center": {"x": self.x + self.width // 2, "y": self.y + self.height // 2}
+        }
+
+def _encode_default(obj):
+    """orjson fallback that expands Detection tuples"""
+    if isinstance(obj, Detection):
+        return obj.as_json()
+    raise TypeError
+
+class DetectionLeader:
+    """Redis lock electing the one instance that runs detection ticks"""
+    TTL = 5.0
+    RENEW_INTERVAL = 1.0
+    
+    def __init__(self, url):
+        self._lock = aioredis.from_url(url).lock('aimmy:detection-loop', timeout=self.TTL)
+        self._held = False
+        self._next_check = 0.0
+    
+    async def hold(self):
+        """Acquire or renew the lock as needed; True while this instance leads"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return self._held
+        self._next_check = now + self.RENEW_INTERVAL
+        try:
+            if self._held:
+                await self._lock.reacquire()
+            else:
+                self._held = await self._lock.acquire(blocking=False)
+                if self._held:
+                    logger.info("Acquired detection leadership")
+        except RedisError as e:
+            if self._held:
+                logger.warning(f"Lost detection leadership: {e}")
+            self._held = False
+        return self._held
+    
+    async def release(self):
+        """Give up the lock so another instance can take over"""
+        if not self._held:
+            return
+        self._held = False
+        self._next_check = 0.0
+        try:
+            await self._lock.release()
+        except RedisError as e:
+            logger.warning(f"Failed to release detection leadership: {e}")
 
 class DetectionEngine:
+    __slots__ = ('config', 'is_running', '_task', '_cfg_version', '_payload_skeleton', '_leader')
+    
     def __init__(self):
-        self.config = self.load_configuration()
+        self.config = DEFAULT_CONFIG
         self.is_running = False
-        self.detection_thread = None
+        self._task = None
+        self._leader = DetectionLeader(REDIS_URL) if REDIS_URL else None
+        # Bumped on every configuration change so the loop can re-snapshot
+        self._cfg_version = 0
+        # Invariant part of every detection_update payload, serialized once
+        self._payload_skeleton = b',"screenshot_size":' + orjson.dumps({"width": 1920, "height": 1080})
         
     def load_configuration(self):
         """Load configuration from environment or defaults"""
-        return {
-            "ConfidenceThreshold": float(os.environ.get('CONFIDENCE_THRESHOLD', 0.5)),
-            "MouseSensitivity": float(os.environ.get('MOUSE_SENSITIVITY', 1.0)),
-            "DetectionInterval": int(os.environ.get('DETECTION_INTERVAL', 50)),
-            "EnableESP": os.environ.get('ENABLE_ESP', 'true').lower() == 'true',
-            "EnableAntiRecoil": os.environ.get('ENABLE_ANTI_RECOIL', 'false').lower() == 'true',
-            "TargetProcess": os.environ.get('TARGET_PROCESS', ""),
-            "FOV": int(os.environ.get('FOV', 100)),
-            "EnableSmoothing": os.environ.get('ENABLE_SMOOTHING', 'true').lower() == 'true',
-            "SmoothingStrength": int(os.environ.get('SMOOTHING_STRENGTH', 5)),
-            "EnableTriggerBot": os.environ.get('ENABLE_TRIGGER_BOT', 'false').lower() == 'true',
-            "TriggerDelay": int(os.environ.get('TRIGGER_DELAY', 50)),
-            "ModelPath": os.environ.get('MODEL_PATH', "Models/yolov8n.onnx"),
-            "EnableDebugMode": os.environ.get('ENABLE_DEBUG_MODE', 'true').lower() == 'true'
-        }
+        return Config.from_env()
     
     def save_configuration(self, config):
         """Save configuration (in production, this would update environment variables)"""
-        self.config = {**self.config, **config}
+        self.config = self.config.updated(config)
+        self._cfg_version += 1
         logger.info("Configuration updated")
     
-    def start_detection(self):
+    async def start_detection(self):
         """Start the detection loop"""
         if self.is_running:
             return {"success": False, "message": "Detection already running"}
         
         self.is_running = True
-        self.detection_thread = threading.Thread(target=self._detection_loop)
-        self.detection_thread.daemon = True
-        self.detection_thread.start()
+        self._task = asyncio.create_task(self._detection_loop())
         
         logger.info("Detection started")
         return {"success": True, "message": "Detection started successfully"}
     
-    def stop_detection(self):
+    async def stop_detection(self):
         """Stop the detection loop"""
         if not self.is_running:
             return {"success": False, "message": "Detection not running"}
         
         self.is_running = False
-        if self.detection_thread:
-            self.detection_thread.join(timeout=1)
+        if self._task:
+            # Cancel rather than wait out the current interval sleep
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._leader:
+            await self._leader.release()
         
         logger.info("Detection stopped")
         return {"success": True, "message": "Detection stopped successfully"}
     
-    def _detection_loop(self):
+    async def _detection_loop(self):
         """Main detection loop (educational simulation)"""
+        deadline = time.monotonic()
+        version = -1
+        interval_s = 0.05
+        threshold = 0.5
         while self.is_running:
             try:
-                start_time = time.time()
+                # Re-read configuration only after it has changed
+                if self._cfg_version != version:
+                    version = self._cfg_version
+                    config = self.config
+                    interval_s = config.detection_interval / 1000.0
+                    threshold = config.confidence_threshold
+                
+                # With a message queue, only the lock holder ticks
+                if self._leader and not await self._leader.hold():
+                    deadline = await self._sleep_until_next_tick(deadline, interval_s)
+                    continue
+                
+                # Nobody is listening; skip the simulated work and the emit.
+                # With a message queue, listeners may be on other instances.
+                if not client_senders and not REDIS_URL:
+                    deadline = await self._sleep_until_next_tick(deadline, interval_s)
+                    continue
+                
+                start_time = time.monotonic()
                 
                 # Simulate detection processing
                 detections = self._simulate_detection()
                 
                 # Calculate processing time
-                processing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+                processing_time = (time.monotonic() - start_time) * 1000  # Convert to milliseconds
                 
-                # Update metrics
-                global detection_metrics
-                detection_metrics["total_detections"] += len(detections)
-                detection_metrics["last_detection_time"] = datetime.now().isoformat()
-                detection_metrics["average_processing_time"] = processing_time
+                # Format the wall-clock timestamp once per tick
+                ts = datetime.fromtimestamp(time.time()).isoformat()
                 
                 # Select best target
                 best_target = None
-                if detections:
-                    best_target = max(detections, key=lambda x: x["confidence"])
-                    if best_target["confidence"] > self.config["ConfidenceThreshold"]:
-                        detection_metrics["successful_targets"] += 1
+                best_confidence = -1.0
+                for detection in detections:
+                    confidence = detection.confidence
+                    if confidence > best_confidence:
+                        best_confidence = confidence
+                        best_target = detection
+                hit = 1 if best_target and best_confidence > threshold else 0
+                
+                # Publish a new metrics snapshot with a single global store
+                global detection_metrics
+                current = detection_metrics
+                detection_metrics = DetectionMetrics(
+                    current.total_detections + len(detections),
+                    ts,
+                    processing_time,
+                    current.successful_targets + hit
+                )
                 
-                # Emit real-time update
-                detection_data = {
-                    "detections": detections,
-                    "best_target": best_target,
-                    "processing_time": processing_time,
-                    "screenshot_size": {"width": 1920, "height": 1080},
-                    "timestamp": datetime.now().isoformat()
-                }
+                # Emit real-time update, splicing the dynamic fields into the
+                # pre-serialized skeleton
+                if detections:
+                    head = b''.join((
+                        b'{"detections":', orjson.dumps(detections, default=_encode_default),
+                        b',"best_target":', orjson.dumps(best_target, default=_encode_default)
+                    ))
+                else:
+                    head = EMPTY_DETECTIONS_HEAD
+                detection_data = b''.join((
+                    head,
+                    b',"processing_time":', f'{processing_time:.2f}'.encode(),
+                    self._payload_skeleton,
+                    b',"timestamp":"', ts.encode(), b'"}'
+                ))
                 
-                socketio.emit('detection_update', detection_data)
+                await publish_detection(encoded_payload(detection_data))
                 
-                # Sleep for detection interval
-                time.sleep(self.config["DetectionInterval"] / 1000.0)
+                # Sleep until the next tick is due
+                deadline = await self._sleep_until_next_tick(deadline, interval_s)
                 
             except Exception as e:
                 logger.error(f"Detection loop error: {e}")
-                time.sleep(0.1)
+                await asyncio.sleep(0.1)
+                deadline = time.monotonic()
+    
+    async def _sleep_until_next_tick(self, deadline, interval_s):
+        """Sleep until the next tick deadline and return it"""
+        deadline += interval_s
+        delay = deadline - time.monotonic()
+        if delay <= 0:
+            # Fell behind schedule; restart from now rather than bursting
+            deadline = time.monotonic()
+        # Always yield, even when late, so the loop never starves the server
+        await asyncio.sleep(max(delay, 0))
+        return deadline
     
     def _simulate_detection(self):
         """Simulate AI detection results for educational purposes"""
         detections = []
         
         # 30% chance of detecting something
-        if random.random() < 0.3:
-            num_detections = random.randint(1, 3)
+        if rng.random() < 0.3:
+            n = int(rng.integers(1, 4))
             
-            for _ in range(num_detections):
-                detection = {
-                    "label": "person",
-                    "confidence": 0.75 + random.random() * 0.25,
-                    "bounding_box": {
-                        "x": random.randint(100, 1400),
-                        "y": random.randint(100, 800),
-                        "width": 100 + random.randint(0, 100),
-                        "height": 150 + random.randint(0, 100)
-                    }
-                }
-                
-                # Add center point
-                detection["center"] = {
-                    "x": detection["bounding_box"]["x"] + detection["bounding_box"]["width"] // 2,
-                    "y": detection["bounding_box"]["y"] + detection["bounding_box"]["height"] // 2
-                }
-                
-                detections.append(detection)
+            # Draw every box in one batch, then convert to plain Python numbers
+            xs = rng.integers(100, 1401, n)
+            ys = rng.integers(100, 801, n)
+            ws = 100 + rng.integers(0, 101, n)
+            hs = 150 + rng.integers(0, 101, n)
+            confs = 0.75 + rng.random(n) * 0.25
+            
+            detections = [
+                Detection("person", conf, x, y, w, h)
+                for conf, x, y, w, h in zip(confs.tolist(), xs.tolist(), ys.tolist(), ws.tolist(), hs.tolist())
+            ]
         
         return detections
 
+# Single engine for the lifetime of the process
+detection_engine = DetectionEngine()
+
 # Web Interface HTML Template
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -217,7 +580,7 @@ HTML_TEMPLATE = """
                 <div class="api-info">
                     <h5><i class="fas fa-info-circle"></i> API Information</h5>
                     <p><strong>Bridge Application Endpoint:</strong></p>
-                    <p class="api-url">POST {{ request.host_url }}api/processes</p>
+                    <p class="api-url">POST {{ host_url }}api/processes</p>
                     <p><small>Use this URL in your bridge application to send process data.</small></p>
                 </div>
             </div>
@@ -334,6 +697,8 @@ HTML_TEMPLATE = """
         socket.on('detection_update', function(data) {
             updateDetectionVisualization(data);
             updatePerformanceMetrics(data);
+            // Acknowledge so the server keeps this client's window open
+            socket.emit('detection_ack');
         });
         
         document.getElementById('startBtn').addEventListener('click', async function() {
@@ -493,102 +858,115 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Compile the index template once; rendered pages are cached per host URL
+INDEX_TEMPLATE = Template(HTML_TEMPLATE, autoescape=True)
+
+@lru_cache(maxsize=32)
+def render_index(host_url):
+    """Render the index page for a given host URL"""
+    return INDEX_TEMPLATE.render(host_url=host_url)
+
+# Static part of the /health body, left open for the timestamp field
+HEALTH_PREFIX = orjson.dumps({"status": "healthy", "service": "Aimmy V2 Educational Edition"})[:-1] + b',"timestamp":"'
+
+# Static part of the bridge POST response, left open for the count field
+PROCESSES_OK_PREFIX = orjson.dumps({"success": True, "message": "Processes received successfully"})[:-1] + b',"count":'
+
 # Routes
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    return render_index(request.host_url), 200, {
+        'Content-Type': 'text/html; charset=utf-8',
+        'Cache-Control': 'public, max-age=300'
+    }
 
 @app.route('/api/detection/start', methods=['POST'])
 def start_detection():
-    global detection_engine
-    if not detection_engine:
-        detection_engine = DetectionEngine()
-    
-    result = detection_engine.start_detection()
-    return jsonify(result)
+    result = run_on_loop(detection_engine.start_detection())
+    return ojsonify(result)
 
 @app.route('/api/detection/stop', methods=['POST'])
 def stop_detection():
-    global detection_engine
-    if detection_engine:
-        result = detection_engine.stop_detection()
-        return jsonify(result)
-    return jsonify({"success": False, "message": "Detection engine not initialized"})
+    result = run_on_loop(detection_engine.stop_detection())
+    return ojsonify(result)
 
 @app.route('/api/configuration', methods=['GET', 'POST'])
 def configuration():
-    global detection_engine
-    if not detection_engine:
-        detection_engine = DetectionEngine()
-    
     if request.method == 'POST':
         config = request.json
         try:
             detection_engine.save_configuration(config)
-            return jsonify({"success": True, "message": "Configuration saved successfully"})
+            return ojsonify({"success": True, "message": "Configuration saved successfully"})
         except Exception as e:
-            return jsonify({"success": False, "message": str(e)}), 400
+            return ojsonify({"success": False, "message": str(e)}), 400
     
-    return jsonify(detection_engine.config)
+    return ojsonify(detection_engine.config.to_dict())
+
+@app.route('/api/reload', methods=['POST'])
+def reload_configuration():
+    detection_engine.save_configuration(detection_engine.load_configuration().to_dict())
+    return ojsonify({"success": True, "message": "Configuration reloaded from environment"})
 
 @app.route('/api/processes', methods=['GET', 'POST'])
 def processes():
-    global bridge_processes
+    global bridge_processes, bridge_processes_json
     
     if request.method == 'POST':
         # Handle POST request from bridge application
         try:
-            data = request.json
-            bridge_processes = data if isinstance(data, list) else []
+            raw = request.get_data(cache=False)
+            parsed = orjson.loads(raw)
+            if type(parsed) is list:
+                bridge_processes = parsed
+            else:
+                bridge_processes = []
+                raw = b'[]'
+            bridge_processes_json = raw
             
             logger.info(f"Received processes from bridge: {len(bridge_processes)} processes")
             
-            # Emit bridge update to connected clients
-            socketio.emit('bridge_update', {
-                'processes': bridge_processes,
-                'timestamp': datetime.now().isoformat(),
-                'count': len(bridge_processes)
-            })
+            # Emit bridge update to connected clients; the validated request
+            # body is spliced in as-is instead of re-encoding the list, and
+            # the encoded count is shared with the HTTP response
+            count = str(len(bridge_processes)).encode()
+            broadcast('bridge_update', encoded_payload(b''.join((
+                b'{"processes":', raw,
+                b',"timestamp":"', datetime.now().isoformat().encode(),
+                b'","count":', count, b'}'
+            ))))
             
-            return jsonify({
-                "success": True, 
-                "message": "Processes received successfully",
-                "count": len(bridge_processes)
-            })
+            return app.response_class(PROCESSES_OK_PREFIX + count + b'}', mimetype='application/json')
         except Exception as e:
             logger.error(f"Error processing bridge data: {e}")
-            return jsonify({"success": False, "message": str(e)}), 400
+            return ojsonify({"success": False, "message": str(e)}), 400
     
-    # Handle GET request - return bridge processes
-    return jsonify(bridge_processes)
+    # Handle GET request - return bridge processes as last received
+    return app.response_class(bridge_processes_json, mimetype='application/json')
 
 @app.route('/api/status', methods=['GET'])
 def status():
-    global detection_engine, detection_metrics, bridge_processes
-    return jsonify({
-        "is_running": detection_engine.is_running if detection_engine else False,
-        "metrics": detection_metrics,
-        "configuration": detection_engine.config if detection_engine else {},
+    global detection_metrics, bridge_processes
+    return ojsonify({
+        "is_running": detection_engine.is_running,
+        "metrics": detection_metrics._asdict(),
+        "configuration": detection_engine.config.to_dict(),
         "bridge_processes": len(bridge_processes),
         "bridge_connected": len(bridge_processes) > 0
     })
 
 @app.route('/health', methods=['GET'])
 def health():
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "Aimmy V2 Educational Edition"
-    })
+    body = b''.join((HEALTH_PREFIX, datetime.now().isoformat().encode(), b'"}'))
+    response = app.response_class(body, mimetype='application/json')
+    response.headers['Cache-Control'] = 'max-age=1'
+    return response
 
 if __name__ == '__main__':
-    # Initialize detection engine
-    detection_engine = DetectionEngine()
-    
     logger.info("=== Aimmy V2 Educational Edition - Production ===")
     logger.info("AI-Powered Object Detection System")
     logger.info("Ready to receive bridge connections")
     
     # Start the server
     port = int(os.environ.get('PORT', 5000))
-    socketio.run(app, host='0.0.0.0', port=port, debug=False)
+    uvicorn.run(asgi, host='0.0.0.0', port=port, loop='uvloop', http='httptools', workers=1,
+                backlog=2048, timeout_keep_alive=15)